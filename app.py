@@ -1,67 +1,91 @@
 # app.py - Minimal Working Demo
 import streamlit as st
 import pandas as pd
-import numpy as np
-import matplotlib.pyplot as plt
+import altair as alt
 from PIL import Image
+import io
 import os
 
 # ---------------------------
 # Logo
 # ---------------------------
 logo_path = "logo.png"  # Make sure logo.png is in the same folder
+
+@st.cache_data
+def load_logo(width):
+    # Resize and encode once per display width; st.image then has nothing left to shrink
+    with Image.open(logo_path) as img:
+        height = round(img.height * width / img.width)
+        thumb = img.resize((width, height), Image.LANCZOS)
+    buf = io.BytesIO()
+    thumb.save(buf, format="PNG")
+    return buf.getvalue()
+
 if os.path.exists(logo_path):
-    st.sidebar.image(logo_path, width=150)
-    st.image(logo_path, width=200)
+    st.sidebar.image(load_logo(150), width=150)
+    st.image(load_logo(200), width=200)
 else:
     st.sidebar.write("Logo not found")
 
 # ---------------------------
 # Sidebar Option
 # ---------------------------
+DEMO_OPTIONS = ("Synthetic Demo",)
+
 st.sidebar.header("Demo Mode")
 option = st.sidebar.selectbox(
     "Select Demo Mode:",
-    
+    DEMO_OPTIONS,
 )
 
 # ---------------------------
 # Synthetic Demo Data
 # ---------------------------
-def synthetic_parameters():
-    data = [
-        {"Node":"7nm","Lg (nm)":15,"gm (µS/µm)":2600,"Vth (V)":0.32,"Ion/Ioff":2.5e6},
-        {"Node":"5nm","Lg (nm)":12,"gm (µS/µm)":2800,"Vth (V)":0.30,"Ion/Ioff":3.0e6},
-        {"Node":"4nm","Lg (nm)":9,"gm (µS/µm)":3100,"Vth (V)":0.28,"Ion/Ioff":4.0e6},
-        {"Node":"3nm","Lg (nm)":7,"gm (µS/µm)":3400,"Vth (V)":0.25,"Ion/Ioff":5.0e6},
-        {"Node":"2nm","Lg (nm)":5,"gm (µS/µm)":3600,"Vth (V)":0.22,"Ion/Ioff":6.0e6},
-    ]
-    return pd.DataFrame(data)
+# Column/value pairs; passed to synthetic_parameters() so edits change its cache key
+SYNTHETIC_DATA = (
+    ("Node",       ("7nm", "5nm", "4nm", "3nm", "2nm")),
+    ("Lg (nm)",    (15, 12, 9, 7, 5)),
+    ("gm (µS/µm)", (2600, 2800, 3100, 3400, 3600)),
+    ("Vth (V)",    (0.32, 0.30, 0.28, 0.25, 0.22)),
+    ("Ion/Ioff",   (2.5e6, 3.0e6, 4.0e6, 5.0e6, 6.0e6)),
+)
+
+@st.cache_data
+def synthetic_parameters(data):
+    df = pd.DataFrame(dict(data))
+    df = df.astype({"Ion/Ioff": "float32"})  # exact in float32, unlike Vth
+    df["Node"] = df["Node"].astype("category")
+    return df
 
 # ---------------------------
 # Plot Scaling Demo
 # ---------------------------
-def plot_scaling(df):
-    fig, axs = plt.subplots(1, 2, figsize=(10,4))
-    axs[0].plot(df["Lg (nm)"], df["gm (µS/µm)"], 'o-')
-    axs[0].set_xlabel("Lg (nm)")
-    axs[0].set_ylabel("gm (µS/µm)")
-    axs[0].set_title("Lg vs gm")
+def scaling_chart(df, x, y, title):
+    # zero=False keeps each axis fitted to the data, as matplotlib did
+    return (
+        alt.Chart(df, title=title)
+        .mark_line(point=True)
+        .encode(
+            x=alt.X(field=x, type="quantitative", scale=alt.Scale(zero=False)),
+            y=alt.Y(field=y, type="quantitative", scale=alt.Scale(zero=False)),
+        )
+    )
 
-    axs[1].plot(df["Vth (V)"], df["Ion/Ioff"], 's-')
-    axs[1].set_xlabel("Vth (V)")
-    axs[1].set_ylabel("Ion/Ioff")
-    axs[1].set_title("Vth vs Ion/Ioff")
-
-    plt.tight_layout()
-    st.pyplot(fig)
+def plot_scaling(df):
+    col_gm, col_ion = st.columns(2)
+    with col_gm:
+        st.altair_chart(scaling_chart(df, "Lg (nm)", "gm (µS/µm)", "Lg vs gm"),
+                        use_container_width=True)
+    with col_ion:
+        st.altair_chart(scaling_chart(df, "Vth (V)", "Ion/Ioff", "Vth vs Ion/Ioff"),
+                        use_container_width=True)
 
 # ---------------------------
 # Run Demo
 # ---------------------------
 if option == "Synthetic Demo":
     st.header("Synthetic FinFET Demo")
-    df = synthetic_parameters()
+    df = synthetic_parameters(SYNTHETIC_DATA)
     st.subheader("Parameters Table")
     st.dataframe(df)
     st.subheader("Scaling Plots")